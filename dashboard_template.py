@@ -0,0 +1,138 @@
+"""
+Render dashboard_template.html, the HTML shared by build_dashboard.py and generate_mock_dashboard.py.
+The template is plain HTML with {{name}} slots; each slot is filled from a binding instead of
+re-running a Python f-string over the whole page.
+"""
+
+import base64
+import html
+import json
+import os
+import re
+from decimal import ROUND_HALF_UP, Decimal
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dashboard_template.html")
+SLOT_RE = re.compile(r"\{\{(\w+)\}\}")
+# Shorter integer series are cheaper as plain JSON than as base64
+TYPED_MIN_LENGTH = 64
+TENTH = Decimal("0.1")
+# Word count chart buckets: each bin starts at its edge, 0 words is a repost and 301 up is 300+
+WORD_COUNT_LABELS = ["0 (Repost)", "1-50", "51-100", "101-200", "201-300", "300+"]
+WORD_COUNT_BINS = np.array([0, 1, 51, 101, 201, 301])
+
+
+def _json_default(obj):
+    """Fallback for values the JSON encoder can't serialize natively."""
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_json(obj, out):
+    """Write a payload as compact, non-ASCII-escaped JSON to a text stream, using orjson when installed."""
+    if orjson is not None:
+        out.write(orjson.dumps(obj, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode())
+    else:
+        json.dump(obj, out, default=_json_default, separators=(",", ":"), ensure_ascii=False)
+
+
+class ScriptSafe:
+    """Text stream wrapper that escapes "</" so JSON written inside a <script> can't close the tag.
+
+    "</" can only occur inside JSON string literals, where "<\\/" is an equivalent escape.
+    """
+
+    def __init__(self, out):
+        self.out = out
+
+    def write(self, s):
+        return self.out.write(s.replace("</", "<\\/"))
+
+
+def to_typed(arr):
+    """Pack a long integer ndarray as base64 little-endian bytes plus a dtype tag (decoded by unpack() in the page)."""
+    if not isinstance(arr, np.ndarray) or arr.dtype.kind not in "iu" or arr.size < TYPED_MIN_LENGTH:
+        return arr
+    lo, hi = int(arr.min()), int(arr.max())
+    for dtype in ("<i1", "<i2", "<i4"):
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return {"dtype": dtype[1:], "b64": base64.b64encode(arr.astype(dtype).tobytes()).decode()}
+    return arr
+
+
+def encode_columns(rows, fields, books):
+    """Turn rows into {field: column}; each books field becomes an ndarray of indices into books[field], with unseen values appended."""
+    columns = {}
+    for field in fields:
+        values = [row[field] for row in rows]
+        if field in books:
+            lookup = {value: i for i, value in enumerate(books[field])}
+            for value in values:
+                if value not in lookup:
+                    lookup[value] = len(books[field])
+                    books[field].append(value)
+            values = np.array([lookup[value] for value in values], dtype=np.int32)
+        columns[field] = values
+    return columns
+
+
+def percent_labels(values, total):
+    """Share of total for each value as a "12.3%" string, for the table columns next to the charts.
+
+    Exact ties round up, as JavaScript's toFixed(1) does, where format() would round half to even.
+    """
+    total = max(int(total), 1)
+    return [f"{Decimal(v / total * 100).quantize(TENTH, ROUND_HALF_UP)}%" for v in np.asarray(values).tolist()]
+
+
+def word_count_buckets(word_counts):
+    """Posts per word count bucket, as the labels/values pair the word count chart takes."""
+    idx = np.searchsorted(WORD_COUNT_BINS, np.asarray(word_counts), side="right") - 1
+    return {"labels": WORD_COUNT_LABELS, "values": np.bincount(idx, minlength=len(WORD_COUNT_LABELS))}
+
+
+def format_text(value):
+    """Format a text binding: ints get thousands separators, everything is HTML-escaped."""
+    if isinstance(value, int):
+        return f"{value:,}"
+    return html.escape(str(value))
+
+
+def load_segments(path=TEMPLATE_PATH):
+    """Split the template into static segments alternating with slot names."""
+    with open(path, encoding="utf-8") as f:
+        return SLOT_RE.split(f.read())
+
+
+# Parsed once at import; write_dashboard only streams the pieces
+TEMPLATE_SEGMENTS = load_segments()
+
+
+def write_dashboard(text, data, out):
+    """Fill the template's slots, writing the page to the text stream out.
+
+    text -- slot name -> value shown in the page (header, stat cards)
+    data -- slot name -> payload embedded as JSON in the script block;
+            ndarray fields of dict payloads (charts, connection columns) are packed with to_typed
+    """
+    text = {name: format_text(value) for name, value in text.items()}
+    for i, segment in enumerate(TEMPLATE_SEGMENTS):
+        if i % 2 == 0:
+            out.write(segment)
+        elif segment in text:
+            out.write(text[segment])
+        else:
+            payload = data[segment]
+            if isinstance(payload, dict):
+                payload = {k: to_typed(v) for k, v in payload.items()}
+            write_json(payload, ScriptSafe(out))
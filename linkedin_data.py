@@ -3,11 +3,31 @@ Shared LinkedIn data loading and processing module.
 Used by both build_dashboard.py and query_linkedin.py.
 """
 
+import numpy as np
 import pandas as pd
+import contextlib
+import functools
+import hashlib
 import os
 import re
 import glob
-from urllib.parse import unquote
+from html import unescape
+
+# Seniority levels counted as the "senior network"
+SENIOR_LEVELS = ["C-Level / Founder", "VP", "Director", "Head of"]
+
+# Columns read from each export CSV (matched after stripping header whitespace); the rest go unparsed
+CONNECTION_COLUMNS = {"First Name", "Last Name", "URL", "Company", "Position", "Connected On"}
+SHARE_COLUMNS = {"Date", "ShareCommentary", "ShareLink", "SharedUrl", "MediaUrl", "Visibility"}
+COMMENT_COLUMNS = {"Date", "Message", "Link"}
+REACTION_COLUMNS = {"Date", "Type", "Link"}
+MESSAGE_COLUMNS = {"CONVERSATION ID", "FROM", "TO", "DATE", "CONTENT"}
+
+# Parsed export CSVs are cached here between runs (git-ignored)
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+# Cached frames are only reused by the same version of this module
+with open(os.path.abspath(__file__), "rb") as _f:
+    MODULE_HASH = hashlib.sha1(_f.read()).hexdigest()
 
 
 def find_export_dir(base_dir=None):
@@ -15,61 +35,137 @@ def find_export_dir(base_dir=None):
     if base_dir is None:
         base_dir = os.path.dirname(os.path.abspath(__file__))
     search_dirs = [base_dir, os.path.join(base_dir, "data exports")]
-    patterns = ["Complete_LinkedInDataExport_*", "Basic_LinkedInDataExport_*"]
+    prefixes = ("Complete_LinkedInDataExport_", "Basic_LinkedInDataExport_")
     candidates = []
     for d in search_dirs:
-        for p in patterns:
-            candidates.extend(glob.glob(os.path.join(d, p)))
-    # Only keep directories (not zip files)
-    candidates = [c for c in candidates if os.path.isdir(c)]
+        try:
+            entries = os.scandir(d)
+        except OSError:  # missing or not a directory
+            continue
+        with entries:
+            # Only keep directories (not zip files); is_dir() mostly answers from the directory listing
+            candidates.extend(e for e in entries if e.name.startswith(prefixes) and e.is_dir())
     if candidates:
-        return max(candidates, key=os.path.getmtime)
+        return max(candidates, key=lambda e: e.stat().st_mtime).path
     raise FileNotFoundError(
         "No LinkedIn export found. Place your LinkedInDataExport folder in the project directory or 'data exports' subfolder."
     )
 
 
+# Title keywords per seniority level, in priority order; the first level with a match wins.
+# Director comes before C-Level because "cto" is a substring of "director".
+SENIORITY_KEYWORDS = [
+    ("Director", ["director"]),
+    ("C-Level / Founder", ["ceo", "cto", "cfo", "coo", "cro", "chief", "founder", "co-founder", "owner", "partner"]),
+    ("VP", ["vp", "vice president"]),
+    ("Head of", ["head of", "head "]),
+    ("Manager / Lead", ["manager", "lead", "team lead"]),
+    ("Senior IC", ["senior", "sr.", "sr "]),
+    ("Junior / Associate", ["junior", "jr.", "intern", "trainee", "associate"]),
+]
+DEFAULT_SENIORITY = "IC / Specialist"
+# One compiled alternation per level, matched against the lowercased title
+SENIORITY_PATTERNS = [(level, re.compile("|".join(map(re.escape, words)))) for level, words in SENIORITY_KEYWORDS]
+
+
 def classify_seniority(position):
     """Classify a job title into a seniority level."""
     pos = str(position).lower()
-    # Check director before C-Level because "cto" substring matches inside "director"
-    if "director" in pos:
-        return "Director"
-    elif any(x in pos for x in ["ceo", "cto", "cfo", "coo", "cro", "chief", "founder", "co-founder", "owner", "partner"]):
-        return "C-Level / Founder"
-    elif any(x in pos for x in ["vp", "vice president"]):
-        return "VP"
-    elif any(x in pos for x in ["head of", "head "]):
-        return "Head of"
-    elif any(x in pos for x in ["manager", "lead", "team lead"]):
-        return "Manager / Lead"
-    elif any(x in pos for x in ["senior", "sr.", "sr "]):
-        return "Senior IC"
-    elif any(x in pos for x in ["junior", "jr.", "intern", "trainee", "associate"]):
-        return "Junior / Associate"
-    else:
-        return "IC / Specialist"
+    for level, pattern in SENIORITY_PATTERNS:
+        if pattern.search(pos):
+            return level
+    return DEFAULT_SENIORITY
+
+
+def classify_seniority_column(positions):
+    """classify_seniority over a Series, classifying each distinct title once."""
+    codes, titles = pd.factorize(positions, use_na_sentinel=False)
+    levels = np.array([classify_seniority(t) for t in titles], dtype=object)
+    return pd.Series(levels[codes], index=positions.index, dtype=object)
+
+
+# Share/activity URN in a post URL; the colons may be percent-encoded (%3A)
+URN_RE = re.compile(r"urn(?::|%3[aA])li(?::|%3[aA])(?:share|activity|ugcPost)(?::|%3[aA])(\d+)")
+
+# Message cleanup: HTML tags, then runs of whitespace
+TAG_RE = re.compile(r"<[^>]+>")
+WHITESPACE_RE = re.compile(r"\s+")
 
 
 def extract_urn(url):
     """Extract the LinkedIn URN ID from a share/activity URL."""
     if not isinstance(url, str):
         return None
-    url = unquote(url)
-    m = re.search(r'urn:li:(?:share|activity|ugcPost):(\d+)', url)
+    m = URN_RE.search(url)
     return m.group(1) if m else None
 
 
+def extract_urn_column(urls):
+    """extract_urn over a Series in one str.extract pass (NaN where there is no URN)."""
+    return urls.fillna("").astype(str).str.extract(URN_RE, expand=False)
+
+
+def cached_export(*names):
+    """Decorator for a loader(export_dir) of several export CSVs that caches its result as a pickle in CACHE_DIR.
+
+    The pickle is reused while the export_dir files in names (path, size, mtime) and this module are unchanged.
+    Files that are missing are part of the key; if all of them are missing, nothing is cached.
+    The cache is best effort: when CACHE_DIR can't be written, the freshly loaded result is returned uncached.
+    """
+    def decorate(load):
+        @functools.wraps(load)
+        def cached(export_dir):
+            paths = [os.path.join(export_dir, name) for name in names]
+            if not any(os.path.exists(path) for path in paths):
+                return load(export_dir)
+            h = hashlib.sha1(MODULE_HASH.encode())
+            for path in paths:
+                stamp = "-"
+                if os.path.exists(path):
+                    st = os.stat(path)
+                    stamp = f"{st.st_mtime_ns}:{st.st_size}"
+                h.update(f"{os.path.abspath(path)}:{stamp}\n".encode())
+            prefix = os.path.join(CACHE_DIR, f"{load.__name__}_")
+            cache = prefix + f"{h.hexdigest()}.pkl"
+            if os.path.exists(cache):
+                try:
+                    return pd.read_pickle(cache)
+                except Exception:
+                    pass  # unreadable (e.g. written by another pandas version) or just replaced: parse again
+            result = load(export_dir)
+            # Written under a per-process temporary name and renamed, so a concurrent build or query
+            # never reads a partial pickle
+            tmp = f"{cache}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                for stale in glob.glob(glob.escape(prefix) + "*.pkl"):
+                    with contextlib.suppress(FileNotFoundError):  # another run may have cleaned it up already
+                        os.remove(stale)
+                pd.to_pickle(result, tmp)
+                os.replace(tmp, cache)
+            except OSError:
+                # Read-only checkout or full disk: skip caching rather than fail the load
+                with contextlib.suppress(OSError):
+                    os.remove(tmp)
+            return result
+        return cached
+    return decorate
+
+
 def load_connections(export_dir):
     """Load and process Connections.csv with seniority classification."""
     path = os.path.join(export_dir, "Connections.csv")
-    df = pd.read_csv(path, skiprows=2)
+    df = pd.read_csv(path, skiprows=2, usecols=lambda c: c.strip() in CONNECTION_COLUMNS)
     df.columns = df.columns.str.strip()
     df["Connected On"] = pd.to_datetime(df["Connected On"], format="mixed", dayfirst=True, errors="coerce")
     for col in ["Company", "Position", "First Name", "Last Name"]:
         df[col] = df[col].fillna("Not Specified").str.strip()
-    df["Full Name"] = df["First Name"] + " " + df["Last Name"]
-    df["Seniority"] = df["Position"].apply(classify_seniority)
+    df["Full Name"] = df["First Name"].str.cat(df["Last Name"], sep=" ")
+    df["Seniority"] = classify_seniority_column(df["Position"])
+    # Categoricals let repeated value_counts/isin/str filters work on integer codes.
+    # Categories keep first-seen order so tie ordering matches the string columns.
+    for col in ["Company", "Position", "Seniority"]:
+        df[col] = pd.Categorical(df[col], categories=df[col].unique())
     return df
 
 
@@ -80,7 +176,7 @@ def load_shares(export_dir):
         df = pd.DataFrame(columns=["Date", "ShareCommentary", "ShareLink", "SharedUrl", "MediaUrl", "Visibility"])
         df["Date"] = pd.to_datetime(df["Date"])
         return df
-    df = pd.read_csv(path, on_bad_lines="skip", engine="python")
+    df = pd.read_csv(path, on_bad_lines="skip", engine="python", usecols=lambda c: c.strip() in SHARE_COLUMNS)
     df.columns = df.columns.str.strip()
     df["Date"] = pd.to_datetime(df["Date"], format="mixed", errors="coerce")
     return df
@@ -93,7 +189,7 @@ def load_comments(export_dir):
         df = pd.DataFrame(columns=["Date", "Message", "Link"])
         df["Date"] = pd.to_datetime(df["Date"])
         return df
-    df = pd.read_csv(path, on_bad_lines="skip", engine="python")
+    df = pd.read_csv(path, on_bad_lines="skip", engine="python", usecols=lambda c: c.strip() in COMMENT_COLUMNS)
     df.columns = df.columns.str.strip()
     df["Date"] = pd.to_datetime(df["Date"], format="mixed", errors="coerce")
     return df
@@ -106,7 +202,7 @@ def load_reactions(export_dir):
         df = pd.DataFrame(columns=["Date", "Type", "Link"])
         df["Date"] = pd.to_datetime(df["Date"])
         return df
-    df = pd.read_csv(path, on_bad_lines="skip", engine="python")
+    df = pd.read_csv(path, on_bad_lines="skip", engine="python", usecols=lambda c: c.strip() in REACTION_COLUMNS)
     df.columns = df.columns.str.strip()
     df["Date"] = pd.to_datetime(df["Date"], format="mixed", errors="coerce")
     return df
@@ -122,67 +218,61 @@ def load_profile(export_dir):
     return df
 
 
+def text_column(df, col):
+    """Column as strings with missing values (or a missing column) as ""."""
+    if col not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    return df[col].fillna("").astype(str)
+
+
 def enrich_posts(shares_df, comments_df):
     """Build enriched post list with type classification and comment counts."""
     shares_clean = shares_df.dropna(subset=["Date"]).copy()
     if "ShareLink" in shares_clean.columns:
-        shares_clean["urn"] = shares_clean["ShareLink"].apply(extract_urn)
+        shares_clean["urn"] = extract_urn_column(shares_clean["ShareLink"])
     else:
         shares_clean["urn"] = None
 
     comments_per_post = {}
     if "Link" in comments_df.columns:
-        comments_df_copy = comments_df.copy()
-        comments_df_copy["urn"] = comments_df_copy["Link"].apply(extract_urn)
-        comments_per_post = comments_df_copy.groupby("urn").size().to_dict()
-
-    posts_list = []
-    for _, r in shares_clean.iterrows():
-        commentary = str(r.get("ShareCommentary", "")) if pd.notna(r.get("ShareCommentary")) else ""
-        commentary = commentary.replace('""', '"').strip().strip('"')
-        word_count = len(commentary.split()) if commentary else 0
-        urn = r.get("urn", "")
-        link = r.get("ShareLink", "")
-        shared_url = str(r.get("SharedUrl", "")) if pd.notna(r.get("SharedUrl")) else ""
-        has_media = bool(str(r.get("MediaUrl", "")).strip()) if pd.notna(r.get("MediaUrl")) else False
-        has_link = bool(shared_url.strip())
-        visibility = str(r.get("Visibility", "")) if pd.notna(r.get("Visibility")) else ""
-
-        if has_media:
-            post_type = "Media"
-        elif has_link:
-            post_type = "Link Share"
-        elif word_count > 100:
-            post_type = "Long Text"
-        elif word_count > 0:
-            post_type = "Short Text"
-        else:
-            post_type = "Repost"
-
-        comment_count = comments_per_post.get(urn, 0) if urn else 0
-
-        posts_list.append({
-            "date": r["Date"].strftime("%Y-%m-%d") if pd.notna(r["Date"]) else "",
-            "day": r["Date"].strftime("%A") if pd.notna(r["Date"]) else "",
-            "hour": int(r["Date"].hour) if pd.notna(r["Date"]) else 0,
-            "content": commentary,
-            "preview": commentary[:200] + ("..." if len(commentary) > 200 else ""),
-            "wordCount": word_count,
-            "type": post_type,
-            "comments": comment_count,
-            "link": link if isinstance(link, str) else "",
-            "visibility": visibility,
-        })
-
-    return posts_list
-
-
+        comments_per_post = extract_urn_column(comments_df["Link"]).value_counts(sort=False).to_dict()
+
+    commentary = text_column(shares_clean, "ShareCommentary").str.replace('""', '"', regex=False).str.strip().str.strip('"')
+    word_count = commentary.str.split().str.len().astype(int)
+    has_media = text_column(shares_clean, "MediaUrl").str.strip().ne("")
+    has_link = text_column(shares_clean, "SharedUrl").str.strip().ne("")
+    post_type = np.select(
+        [has_media, has_link, word_count > 100, word_count > 0],
+        ["Media", "Link Share", "Long Text", "Short Text"],
+        default="Repost",
+    )
+    comments = shares_clean["urn"].map(comments_per_post).fillna(0).astype(int)
+    links = shares_clean["ShareLink"] if "ShareLink" in shares_clean.columns else pd.Series("", index=shares_clean.index)
+    dates = shares_clean["Date"]
+
+    posts = pd.DataFrame({
+        "date": dates.dt.strftime("%Y-%m-%d"),
+        "day": dates.dt.strftime("%A"),
+        "hour": dates.dt.hour.astype(int),
+        "content": commentary,
+        "preview": commentary.str.slice(0, 200) + np.where(commentary.str.len() > 200, "...", ""),
+        "wordCount": word_count,
+        "type": post_type,
+        "comments": comments,
+        "link": [link if isinstance(link, str) else "" for link in links],
+        "visibility": text_column(shares_clean, "Visibility"),
+    })
+    return posts.to_dict("records")
+
+
+# Cached on its own so that the dashboard, which never reads messages, doesn't parse or unpickle them
+@cached_export("messages.csv")
 def load_messages(export_dir):
     """Load and process messages.csv, grouped into conversations."""
     path = os.path.join(export_dir, "messages.csv")
     if not os.path.exists(path):
         return pd.DataFrame()
-    df = pd.read_csv(path, on_bad_lines="skip", engine="python")
+    df = pd.read_csv(path, on_bad_lines="skip", engine="python", usecols=lambda c: c.strip() in MESSAGE_COLUMNS)
     df.columns = df.columns.str.strip()
     df["DATE"] = pd.to_datetime(df["DATE"], format="mixed", errors="coerce", utc=True)
     return df
@@ -193,62 +283,56 @@ def build_conversations(messages_df, owner_name="Pavel Averin"):
     if messages_df.empty:
         return []
 
-    convos = []
-    for conv_id, msgs in messages_df.groupby("CONVERSATION ID"):
-        msgs = msgs.sort_values("DATE", ascending=True)
-
-        participants = set()
-        for _, m in msgs.iterrows():
-            fr = str(m.get("FROM", ""))
-            to = str(m.get("TO", ""))
-            if fr and fr != "nan":
-                participants.add(fr)
-            if to and to != "nan":
-                participants.add(to)
-        participants.discard(owner_name)
-        other = ", ".join(sorted(participants)) if participants else "Unknown"
-
-        last_msg = msgs.iloc[-1]
-        last_from = str(last_msg.get("FROM", ""))
-        last_date = last_msg["DATE"]
-
-        content = str(last_msg.get("CONTENT", ""))
-        # Strip HTML tags
-        content = re.sub(r"<[^>]+>", " ", content)
-        try:
-            from html import unescape
-            content = unescape(content)
-        except Exception:
-            pass
-        content = re.sub(r"\s+", " ", content).strip()
-
-        convos.append({
-            "other": other,
-            "msg_count": len(msgs),
-            "last_date": last_date.strftime("%Y-%m-%d %H:%M") if pd.notna(last_date) else "",
-            "last_from": last_from,
-            "last_content": content[:500] + ("..." if len(content) > 500 else ""),
-            "awaiting_your_reply": last_from != owner_name,
-        })
+    # One sort puts every conversation's messages together, oldest first; its last row is the latest message
+    df = messages_df.dropna(subset=["CONVERSATION ID"]).sort_values(["CONVERSATION ID", "DATE"], kind="stable")
+    if df.empty:
+        return []
+    conv_ids = df["CONVERSATION ID"]
+    last = df.drop_duplicates("CONVERSATION ID", keep="last").set_index("CONVERSATION ID")
+
+    # Everyone who sent or received a message in the conversation, except the owner
+    people = pd.DataFrame({
+        "conv": pd.concat([conv_ids, conv_ids], ignore_index=True),
+        "who": pd.concat([text_column(df, "FROM"), text_column(df, "TO")], ignore_index=True),
+    })
+    people = people[~people["who"].isin(["", "nan", owner_name])].drop_duplicates().sort_values("who", kind="stable")
+    other = people.groupby("conv")["who"].agg(", ".join).reindex(last.index).fillna("Unknown")
+
+    blank = pd.Series("", index=last.index)
+    last_from = last.get("FROM", blank).map(str)
+    # Strip HTML tags, decode entities, collapse whitespace
+    content = last.get("CONTENT", blank).map(str).str.replace(TAG_RE, " ", regex=True).map(unescape).str.replace(WHITESPACE_RE, " ", regex=True).str.strip()
+    last_date = last["DATE"]
+
+    convos = pd.DataFrame({
+        "other": other,
+        "msg_count": conv_ids.value_counts(sort=False).reindex(last.index).astype(int),
+        "last_date": last_date.dt.strftime("%Y-%m-%d %H:%M").fillna(""),
+        "last_from": last_from,
+        "last_content": content.str.slice(0, 500) + np.where(content.str.len() > 500, "...", ""),
+        "awaiting_your_reply": last_from.ne(owner_name),
+    }).to_dict("records")
 
     convos.sort(key=lambda x: x["last_date"], reverse=True)
     return convos
 
 
-def load_all(export_dir):
-    """Load all LinkedIn data. Returns dict with DataFrames and enriched posts."""
-    conn_df = load_connections(export_dir)
+# One pickle for everything the dashboard reads: a build reads a single file and skips enrich_posts
+@cached_export("Connections.csv", "Shares.csv", "Comments.csv", "Reactions.csv")
+def load_network(export_dir):
+    """Load connections, shares, comments and reactions. Returns dict with DataFrames and enriched posts."""
     shares_df = load_shares(export_dir)
     comments_df = load_comments(export_dir)
-    reactions_df = load_reactions(export_dir)
-    messages_df = load_messages(export_dir)
-    posts_list = enrich_posts(shares_df, comments_df)
 
     return {
-        "connections": conn_df,
+        "connections": load_connections(export_dir),
         "shares": shares_df,
         "comments": comments_df,
-        "reactions": reactions_df,
-        "messages": messages_df,
-        "posts": posts_list,
+        "reactions": load_reactions(export_dir),
+        "posts": enrich_posts(shares_df, comments_df),
     }
+
+
+def load_all(export_dir):
+    """Load all LinkedIn data. Returns dict with DataFrames and enriched posts."""
+    return {**load_network(export_dir), "messages": load_messages(export_dir)}
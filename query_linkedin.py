@@ -18,7 +18,7 @@ import sys
 import pandas as pd
 from datetime import datetime, timedelta
 
-from linkedin_data import find_export_dir, load_all, build_conversations
+from linkedin_data import SENIOR_LEVELS, find_export_dir, load_all, build_conversations
 
 
 def build_summary(data):
@@ -27,9 +27,7 @@ def build_summary(data):
     reactions_df = data["reactions"]
     posts = data["posts"]
 
-    senior_count = int(conn_df[conn_df["Seniority"].isin(
-        ["C-Level / Founder", "VP", "Director", "Head of"]
-    )].shape[0])
+    senior_count = int(conn_df["Seniority"].isin(SENIOR_LEVELS).sum())
 
     top_companies = conn_df["Company"].value_counts().head(20)
     seniority_dist = conn_df["Seniority"].value_counts()
@@ -90,15 +88,21 @@ def query_connections(data, args):
     df = df.sort_values("Connected On", ascending=False)
     total = len(df)
 
+    top = df.head(args.limit)
+    connected = top["Connected On"].dt.strftime("%Y-%m-%d").fillna("")
+    urls = top["URL"].fillna("") if "URL" in top.columns else [""] * len(top)
+
     records = []
-    for _, r in df.head(args.limit).iterrows():
+    for name, company, position, seniority, conn, url in zip(
+        top["Full Name"], top["Company"], top["Position"], top["Seniority"], connected, urls
+    ):
         records.append({
-            "name": r["Full Name"],
-            "company": r["Company"],
-            "position": r["Position"],
-            "seniority": r["Seniority"],
-            "connected": r["Connected On"].strftime("%Y-%m-%d") if pd.notna(r["Connected On"]) else "",
-            "url": r.get("URL", "") if pd.notna(r.get("URL", "")) else "",
+            "name": name,
+            "company": company,
+            "position": position,
+            "seniority": seniority,
+            "connected": conn,
+            "url": url,
         })
 
     return {
@@ -173,12 +177,17 @@ def query_comments(data, args):
     df = df.sort_values("Date", ascending=False)
     total = len(df)
 
+    top = df.head(args.limit)
+    dates = top["Date"].dt.strftime("%Y-%m-%d").fillna("")
+    messages = top["Message"].fillna("").astype(str) if "Message" in top.columns else [""] * len(top)
+    links = top["Link"].fillna("").astype(str) if "Link" in top.columns else [""] * len(top)
+
     records = []
-    for _, r in df.head(args.limit).iterrows():
+    for date, message, link in zip(dates, messages, links):
         records.append({
-            "date": r["Date"].strftime("%Y-%m-%d") if pd.notna(r["Date"]) else "",
-            "message": str(r.get("Message", "")) if pd.notna(r.get("Message")) else "",
-            "link": str(r.get("Link", "")) if pd.notna(r.get("Link")) else "",
+            "date": date,
+            "message": message,
+            "link": link,
         })
 
     return {
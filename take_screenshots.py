@@ -1,12 +1,20 @@
 """
 Take screenshots of each dashboard tab using Playwright.
+Tabs are captured in parallel, each in its own browser context.
+With --watch the browser stays open and the screenshots are retaken whenever the dashboard file changes.
 """
 
-from playwright.sync_api import sync_playwright
-import time
+import argparse
+import asyncio
+import os
 
-DASHBOARD = "file:///Users/pavelaverin/Desktop/LinkedIn Skill/mock_dashboard.html"
+from playwright.async_api import async_playwright
+
+DASHBOARD_PATH = "/Users/pavelaverin/Desktop/LinkedIn Skill/mock_dashboard.html"
+DASHBOARD = "file://" + DASHBOARD_PATH
 OUT_DIR = "/Users/pavelaverin/Desktop/LinkedIn Skill/screenshots"
+# Seconds between checks of the dashboard's mtime in --watch mode
+WATCH_INTERVAL = 1.0
 
 TABS = [
     ("overview", "01-overview.png"),
@@ -17,40 +25,65 @@ TABS = [
     ("clusters", "06-clusters.png"),
 ]
 
-with sync_playwright() as p:
-    browser = p.chromium.launch()
-    page = browser.new_page(viewport={"width": 1440, "height": 900}, device_scale_factor=2)
-    page.goto(DASHBOARD)
-    page.wait_for_timeout(2000)  # Let Chart.js render
-
-    for section_id, filename in TABS:
-        # Click nav link
-        page.click(f'nav a[data-section="{section_id}"]')
-        page.wait_for_timeout(800)
-
-        # For connections tab, add some sample filters to show the feature
-        if section_id == "connections":
-            # Add a seniority filter
-            page.click("#connAddFilterBtn")
-            page.wait_for_timeout(300)
-            page.select_option("#connFilterType", "seniority")
-            page.wait_for_timeout(200)
-            page.select_option("#connFilterValue", "Director")
-            page.click("#connApplyFilter")
-            page.wait_for_timeout(300)
-            # Add a company filter
-            page.click("#connAddFilterBtn")
-            page.wait_for_timeout(300)
-            page.select_option("#connFilterType", "company")
-            page.wait_for_timeout(200)
-            page.select_option("#connFilterValue", "Google")
-            page.click("#connApplyFilter")
-            page.wait_for_timeout(500)
-
-        # Screenshot the visible area
-        page.screenshot(path=f"{OUT_DIR}/{filename}", full_page=False)
-        print(f"Captured {filename}")
-
-    browser.close()
-
-print("All screenshots saved!")
+
+async def capture(browser, section_id, filename):
+    """Open the dashboard in a fresh context, switch to one tab and screenshot it."""
+    context = await browser.new_context(viewport={"width": 1440, "height": 900}, device_scale_factor=2)
+    page = await context.new_page()
+    await page.goto(DASHBOARD)  # Resolves on the load event, after Chart.js and the page script have run
+
+    # Click nav link; the click handler shows the section and builds its charts (no animation) synchronously
+    await page.click(f'nav a[data-section="{section_id}"]')
+    await page.wait_for_selector(f"#{section_id}.section.active")
+
+    # For connections tab, add some sample filters to show the feature
+    if section_id == "connections":
+        tags = page.locator("#connFilterBar .filter-tag")
+        for filter_type, value in [("seniority", "Director"), ("company", "Google")]:
+            await page.click("#connAddFilterBtn")
+            await page.wait_for_selector("#connFilterMenu.open")
+            # select_option waits for the value list that the type change fills in
+            await page.select_option("#connFilterType", filter_type)
+            await page.select_option("#connFilterValue", value)
+            await page.click("#connApplyFilter")
+            await tags.filter(has_text=value).wait_for()
+
+    # Screenshot the visible area
+    await page.screenshot(path=f"{OUT_DIR}/{filename}", full_page=False)
+    await context.close()
+    print(f"Captured {filename}")
+
+
+async def capture_all(browser):
+    """Screenshot every tab in parallel with the one browser."""
+    await asyncio.gather(*(capture(browser, section_id, filename) for section_id, filename in TABS))
+    print("All screenshots saved!")
+
+
+async def main(watch):
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        await capture_all(browser)
+        if watch:
+            # Reuse the running browser; retake once the file has stopped changing for one interval,
+            # so a dashboard that is still being written isn't captured half-done
+            print(f"Watching {DASHBOARD_PATH} for changes (Ctrl+C to stop)")
+            captured = seen = os.path.getmtime(DASHBOARD_PATH)
+            while True:
+                await asyncio.sleep(WATCH_INTERVAL)
+                mtime = os.path.getmtime(DASHBOARD_PATH)
+                if mtime == seen and mtime != captured:
+                    captured = mtime
+                    await capture_all(browser)
+                seen = mtime
+        await browser.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Screenshot each dashboard tab")
+    parser.add_argument("--watch", action="store_true", help="Keep the browser open and retake screenshots when the dashboard changes")
+    args = parser.parse_args()
+    try:
+        asyncio.run(main(args.watch))
+    except KeyboardInterrupt:
+        pass